@@ -9,13 +9,13 @@ from flint.project import Project
 __version__ = '0.0.1'
 
 
-def parse(*paths, includes=None, excludes=None):
+def parse(*paths, includes=None, excludes=None, jobs=1):
     include_dirs = includes if includes else []
     exclude_dirs = excludes if excludes else []
 
     project = Project()
     project.include_dirs = include_dirs
 
-    project.parse(*paths, excludes=exclude_dirs)
+    project.parse(*paths, excludes=exclude_dirs, jobs=jobs)
 
     return project
@@ -4,12 +4,32 @@
 :license: Apache License, Version 2.0, see LICENSE for details.
 """
 
+# Statement keywords which may precede a parenthesis, e.g. `else if (...)`,
+# `do while (...)`, `select case (...)`, or `type is (...)`
+keywords = frozenset((
+    'case',
+    'class',
+    'forall',
+    'if',
+    'is',
+    'rank',
+    'type',
+    'where',
+    'while',
+))
+
 
 def get_callable_symbols(line, variables):
-    names = [
-        b for a, b, c in zip(line, line[1:], line[2:])
-        if a != '%' and c == '(' and b[0].isalpha()
-        and b not in variables
-    ]
+    # NOTE: This is applied to every statement in the execution part, so we
+    #   walk the indices once and only inspect names which precede `(`.
+    #   `variables` holds lowercase names, so it is searched by token key.
+    names = []
+    for idx in range(1, len(line) - 1):
+        if line[idx + 1] == '(':
+            name = line[idx]
+            if (name[0].isalpha() and line[idx - 1] != '%'
+                    and name.key not in variables
+                    and name.key not in keywords):
+                names.append(name)
 
     return names
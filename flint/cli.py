@@ -63,6 +63,18 @@ def parse():
         }
     }
 
+    arg_jobs = {
+        'flags': ('--jobs', '-j'),
+        'parameters': {
+            'action': 'store',
+            'dest': 'jobs',
+            'metavar': 'n',
+            'type': int,
+            'default': 1,
+            'help': 'Number of processes used to parse sources',
+        }
+    }
+
     # gendoc flags
     # NOTE: Should we make this mandatory (i.e. positional)?
     arg_docdir = {
@@ -81,6 +93,7 @@ def parse():
     format_cmd.add_argument(*arg_srcdirs['flags'], **arg_srcdirs['parameters'])
     format_cmd.add_argument(*arg_incdirs['flags'], **arg_incdirs['parameters'])
     format_cmd.add_argument(*arg_exclude['flags'], **arg_exclude['parameters'])
+    format_cmd.add_argument(*arg_jobs['flags'], **arg_jobs['parameters'])
 
     # gendoc
     gendoc_cmd = subparsers.add_parser('gendoc')
@@ -89,6 +102,7 @@ def parse():
     gendoc_cmd.add_argument(*arg_docdir['flags'], **arg_docdir['parameters'])
     gendoc_cmd.add_argument(*arg_incdirs['flags'], **arg_incdirs['parameters'])
     gendoc_cmd.add_argument(*arg_exclude['flags'], **arg_exclude['parameters'])
+    gendoc_cmd.add_argument(*arg_jobs['flags'], **arg_jobs['parameters'])
 
     # tag
     tag_cmd = subparsers.add_parser('tag')
@@ -96,6 +110,7 @@ def parse():
     tag_cmd.add_argument(*arg_srcdirs['flags'], **arg_srcdirs['parameters'])
     tag_cmd.add_argument(*arg_incdirs['flags'], **arg_incdirs['parameters'])
     tag_cmd.add_argument(*arg_exclude['flags'], **arg_exclude['parameters'])
+    tag_cmd.add_argument(*arg_jobs['flags'], **arg_jobs['parameters'])
 
     # report
     report_cmd = subparsers.add_parser('report')
@@ -103,6 +118,7 @@ def parse():
     report_cmd.add_argument(*arg_srcdirs['flags'], **arg_srcdirs['parameters'])
     report_cmd.add_argument(*arg_incdirs['flags'], **arg_incdirs['parameters'])
     report_cmd.add_argument(*arg_exclude['flags'], **arg_exclude['parameters'])
+    report_cmd.add_argument(*arg_jobs['flags'], **arg_jobs['parameters'])
 
     # If no argument given, then print the help page
     if len(sys.argv) == 1:
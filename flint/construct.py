@@ -4,7 +4,6 @@
 :license: Apache License, Version 2.0, see LICENSE for details.
 """
 from flint.calls import get_callable_symbols
-from flint.statement import Statement
 
 
 class Construct(object):
@@ -21,6 +20,7 @@ class Construct(object):
         'change'
         'select',
     ]
+    _construct_set = frozenset(construct_types)
 
     # TODO: Ignore these for now
     construct_kw_pairs = [
@@ -38,7 +38,7 @@ class Construct(object):
             stmt = stmt[1:]
 
         # TODO: Actual rules vary for every construct type, not just 'if'
-        if stmt[0] in Construct.construct_types:
+        if stmt[0].key in Construct._construct_set:
             if stmt[0] == 'if':
                 return (stmt[0], stmt[-1]) == ('if', 'then')
             elif stmt[0] == 'where':
@@ -61,10 +61,11 @@ class Construct(object):
                 return True
 
     def end_statement(self, stmt):
-        if stmt[0].startswith('end'):
-            if len(stmt) == 1 and stmt[0] in ('end', 'end' + self.ctype):
+        if stmt[0].key.startswith('end'):
+            if len(stmt) == 1 and stmt[0].key in self._end_forms:
                 return True
-            elif len(stmt) == 2 and (stmt[0], stmt[1]) == ('end', self.ctype):
+            elif (len(stmt) == 2 and stmt[0].key == 'end'
+                    and stmt[1] == self.ctype):
                 return True
             else:
                 return False
@@ -80,6 +81,9 @@ class Construct(object):
         self.ctype = None
         self.name = None
 
+        # Single-token end statements (e.g. `end`, `enddo`), set by parse()
+        self._end_forms = frozenset()
+
         # Program unit containing the construct
         self.unit = unit
 
@@ -99,13 +103,16 @@ class Construct(object):
         else:
             self.ctype = stmt[0]
 
+        self._end_forms = frozenset(('end', 'end' + self.ctype.lower()))
+
         stmt.tag = 'C'
         self.statements.append(stmt)
 
         # Parse the contents of the construct
         for stmt in statements:
-            callables = get_callable_symbols(stmt, self.unit._arrays)
-            self.unit.callees.update(get_callable_symbols(stmt, callables))
+            self.unit.callees.update(
+                get_callable_symbols(stmt, self.unit._arrays)
+            )
 
             if Construct.construct_stmt(stmt):
                 cons = Construct(self.unit, depth=self.depth + 1)
@@ -8,21 +8,33 @@
 doc_tokens = ('!<', '!>', '!!')
 grp_tokens = ('!>@{', '!>@}')
 
+# The group markers have equal length, so a token's leading slice can be
+# checked against them in a single set lookup.
+grp_width = len(grp_tokens[0])
+grp_markers = frozenset(grp_tokens)
 
+
+# NOTE: Liminal lists are short, so these are plain loops which test all of
+#   the markers at once: is_docstring() with one startswith() call, and
+#   is_docgroup() with one set lookup.  The markers can follow whitespace and
+#   newlines, so every token must be checked.
 def is_docstring(tokens):
-    return any(tok.startswith(dtok) for tok in tokens for dtok in doc_tokens)
+    for tok in tokens:
+        if tok.startswith(doc_tokens):
+            return True
+    return False
 
 
 def is_docgroup(tokens):
-    return any(tok.startswith(dtok) for tok in tokens for dtok in grp_tokens)
+    for tok in tokens:
+        if tok[:grp_width] in grp_markers:
+            return True
+    return False
 
 
 def docstrip(tokens, oneline=True):
     # XXX: Replace [3:] with something more robust
-    docstr_tokens = [
-        tok[3:] for tok in tokens
-        if any(tok.startswith(d) for d in doc_tokens)
-    ]
+    docstr_tokens = [tok[3:] for tok in tokens if tok.startswith(doc_tokens)]
 
     # NOTE: When oneline is true, this converts blank lines (converted to empty
     #   strings) to spaces.  It's not really clear what we want here.  If you
@@ -4,7 +4,6 @@
 :license: Apache License, Version 2.0, see LICENSE for details.
 """
 from flint.document import Document
-from flint.statement import Statement
 
 
 class Interface(object):
@@ -59,7 +58,10 @@ class Interface(object):
 
     def procedure_stmt(self, stmt):
         # XXX: Assert self.name is set?
-        return stmt[0] == 'procedure' or stmt[:2] == ('module', 'procedure')
+        return (
+            stmt[0] == 'procedure'
+            or tuple(stmt[:2]) == ('module', 'procedure')
+        )
 
     def parse_procedure_stmt(self, stmt):
         stmt.tag = 'P'
@@ -73,7 +75,7 @@ class Interface(object):
             tok = next(tokens)
 
         assert tok == 'procedure'
-        next(tokens)
+        tok = next(tokens)
 
         if tok == '::':
             tok = next(tokens)
@@ -83,10 +85,11 @@ class Interface(object):
         self.procedures.append(tok)
 
     def end_interface_stmt(self, stmt):
-        if stmt[0].startswith('end'):
-            if len(stmt) == 1 and stmt[0] == 'endinterface':
+        if stmt[0].key.startswith('end'):
+            if len(stmt) == 1 and stmt[0].key == 'endinterface':
                 return True
-            elif len(stmt) >= 2 and (stmt[0], stmt[1]) == ('end', 'interface'):
+            elif (len(stmt) >= 2 and stmt[0].key == 'end'
+                    and stmt[1].key == 'interface'):
                 # TODO: other generic-spec tests
                 if len(stmt) >= 3:
                     assert stmt[2] == self.name
@@ -295,3 +295,5 @@ intrinsic_fns = [
     'allocate',
     'deallocate',
 ]
+
+intrinsic_fns_set = frozenset(intrinsic_fns)
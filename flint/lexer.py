@@ -9,20 +9,27 @@ file) and each iteration returns the next complete Fortran statement.
 from collections import deque
 from collections import OrderedDict
 import itertools
+import logging
 import os
-import sys
 
 from flint.scanner import Scanner
 from flint.statement import Statement
 from flint.token import Token, PToken
 
+logger = logging.getLogger(__name__)
+
 
 class Lexer(object):
     """An iterator which returns the lexemes from an input stream."""
-    def __init__(self, source, include_paths=None):
+    def __init__(self, source, include_paths=None, include_index=None):
         self.source = source
         self.include_paths = include_paths if include_paths else []
 
+        # Resolved paths of #include files, shared across lexers
+        # NOTE: Unresolved files are also stored (as None), so that each file
+        #   is only searched for once.
+        self.include_index = include_index if include_index is not None else {}
+
         # A reuseable Lexeme scanner
         self.scanner = Scanner()
 
@@ -317,29 +324,39 @@ class Lexer(object):
             inc_fname = words[1][1:-1]
 
             # Search for path of include file
-            inc_path = None
-            for ipath in self.include_paths:
-                test_path = os.path.join(ipath, inc_fname)
-                if os.path.isfile(test_path):
-                    inc_path = test_path
-                    break
+            try:
+                inc_path = self.include_index[inc_fname]
+            except KeyError:
+                inc_path = find_include(inc_fname, self.include_paths)
+                self.include_index[inc_fname] = inc_path
 
             if inc_path:
                 with open(inc_path) as inc:
-                    lexer = Lexer(inc, self.include_paths)
+                    lexer = Lexer(inc, self.include_paths, self.include_index)
                     lexer.defines = self.defines
                     self.includes = deque()
                     for stmt in lexer:
                         self.includes.append(stmt)
             else:
-                print('f90lex: Include file {} not found; skipping.'
-                      ''.format(inc_fname), file=sys.stderr)
+                logger.warning('f90lex: Include file %s not found; skipping.',
+                               inc_fname)
 
         # What else is there?  #pragma, #line, #error, ... ?
 
         else:
-            print('f90lex: unsupported preprocess directive: {}'
-                  ''.format(line).rstrip(), file=sys.stderr)
+            logger.warning('f90lex: unsupported preprocess directive: %s',
+                           line.rstrip())
+
+
+def find_include(fname, include_paths):
+    """Return the path of the first file ``fname`` in ``include_paths``, or
+    ``None`` if it is not found."""
+    for ipath in include_paths:
+        test_path = os.path.join(ipath, fname)
+        if os.path.isfile(test_path):
+            return test_path
+
+    return None
 
 
 def is_liminal(lexeme):
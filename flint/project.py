@@ -3,6 +3,8 @@
 :copyright: Copyright 2021 Marshall Ward, see AUTHORS for details.
 :license: Apache License, Version 2.0, see LICENSE for details.
 """
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 import os
 
 from flint.source import Source
@@ -11,7 +13,10 @@ from flint.units import Module
 
 class Project(object):
     # TODO: make a control parameter
-    extensions = ['.f90', '.F90']
+    extensions = ('.f90', '.F90')
+
+    # Smallest number of sources which are worth parsing in parallel
+    min_parallel_sources = 8
 
     def __init__(self):
         # Source code
@@ -19,6 +24,8 @@ class Project(object):
         self.directories = []
         self.sources = []
         self.include_dirs = []
+        # Resolved #include paths, shared by all sources
+        self.include_index = {}
 
         # Program structure
         self.main = None
@@ -31,7 +38,14 @@ class Project(object):
 
     # TODO: *paths is generally a bad idea for a public API.  I am only using
     #   it here to get sensible output in my MOM6 tests.
-    def parse(self, *paths, excludes=None):
+    def parse(self, *paths, excludes=None, jobs=1):
+        """Parse the source files in ``paths``.
+
+        Sources are parsed in ``jobs`` worker processes when this exceeds 1,
+        or in one worker per CPU if ``jobs`` is None.  Scripts which enable
+        worker processes must guard their entry point with
+        ``if __name__ == '__main__':`` on platforms which spawn processes.
+        """
         # Set up the exclusion list
         if excludes:
             exclude_dirs = [os.path.normpath(p) for p in excludes]
@@ -53,21 +67,55 @@ class Project(object):
                 self.directories.append(root)
 
                 # Skip any excluded directories
-                if os.path.normpath(root) in exclude_dirs:
-                    continue
+                # NOTE: Their files are still available to #include
+                excluded = os.path.normpath(root) in exclude_dirs
 
                 for fname in files:
                     fpath = os.path.join(root, fname)
 
-                    if os.path.splitext(fname)[1] in Project.extensions:
+                    # Index the file for #include resolution, following the
+                    # search order of self.directories.  (Only regular files
+                    # can be included, so skip e.g. broken symlinks.)
+                    if (fname not in self.include_index
+                            and os.path.isfile(fpath)):
+                        self.include_index[fname] = fpath
+
+                    if not excluded and fname.endswith(Project.extensions):
                         filepaths.append(fpath)
 
-        for fpath in filepaths:
-            f90file = Source()
-            f90file.include_paths = self.directories + self.include_dirs
-            f90file.parse(fpath, graph=self.graph)
+        # Search path for #include files, without any repeated directories
+        include_paths = list(dict.fromkeys(
+            self.directories + self.include_dirs
+        ))
+
+        if jobs is None:
+            jobs = os.cpu_count() or 1
 
-            self.sources.append(f90file)
+        if jobs <= 1 or len(filepaths) < Project.min_parallel_sources:
+            for fpath in filepaths:
+                f90file = Source()
+                f90file.include_paths = include_paths
+                f90file.include_index = self.include_index
+                f90file.parse(fpath, graph=self.graph)
+
+                self.sources.append(f90file)
+        else:
+            # Sources are independent until the call graph is merged, so
+            # parse them in separate processes.
+            chunksize = max(1, len(filepaths) // (4 * jobs))
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = pool.map(
+                    parse_source,
+                    filepaths,
+                    itertools.repeat(include_paths),
+                    itertools.repeat(self.include_index),
+                    chunksize=chunksize,
+                )
+
+                for f90file, graph in results:
+                    self.sources.append(f90file)
+                    for proc, callers in graph.items():
+                        self.graph.setdefault(proc, set()).update(callers)
 
         # Generate list of modules
         for src in self.sources:
@@ -82,3 +130,22 @@ class Project(object):
         for unit in self.externals:
             extmod.subprograms.append(unit)
         self.modules.append(extmod)
+
+
+def parse_source(path, include_paths, include_index):
+    """Parse the source file at ``path``, and return the ``Source`` and its
+    call graph.
+
+    This is a module function so that it can be sent to worker processes.
+    """
+    src = Source()
+    src.include_paths = include_paths
+    src.include_index = include_index
+
+    graph = {}
+    src.parse(path, graph=graph)
+
+    # Do not send the project's #include index back with every result
+    src.include_index = {}
+
+    return src, graph
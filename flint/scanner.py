@@ -10,7 +10,7 @@ used in the future.
 :copyright: Copyright 2021 Marshall Ward, see AUTHORS for details.
 :license: Apache License, Version 2.0, see LICENSE for details.
 """
-import itertools
+import re
 
 
 class Scanner(object):
@@ -20,8 +20,12 @@ class Scanner(object):
     # Token pairs (syntax and operators)
     pairs = ('::', '=>', '**', '//', '==', '/=', '<=', '>=', '(/', '/)')
 
+    # Character runs which are matched in a single regex call
+    blank_run = re.compile(r'[ \t]*')
+    name_run = re.compile(r'\w*')
+
     def __init__(self):
-        self.characters = None
+        self.line = None
         self.char = None
         self.idx = None
 
@@ -31,8 +35,8 @@ class Scanner(object):
         """Tokenize a line of Fortran source."""
         tokens = []
 
+        self.line = line
         self.idx = -1   # Bogus value to ensure idx = 0 after first iteration
-        self.characters = iter(line)
         self.update_chars()
 
         # String line continuation?
@@ -41,9 +45,9 @@ class Scanner(object):
         while self.char != '\n':
             word = ''
             if self.char in ' \t':
-                while self.char in ' \t':
-                    word += self.char
-                    self.update_chars()
+                end = Scanner.blank_run.match(line, self.idx).end()
+                word = line[self.idx:end]
+                self.jump_to(end)
             elif self.char in '"\'' or (self.prior_delim and not lc):
                 word = self.parse_string()
                 if self.prior_delim:
@@ -117,19 +121,10 @@ class Scanner(object):
         return tokens
 
     def parse_name(self, line):
-        end = self.idx
-        for char in line[self.idx:]:
-            if not char.isalnum() and char != '_':
-                break
-            end += 1
-
+        # NOTE: `\w` matches the same characters as isalnum() or '_'
+        end = Scanner.name_run.match(line, self.idx).end()
         word = line[self.idx:end]
-
-        self.idx = end - 1
-        # Update iterator, minus first character which was already read
-        self.characters = itertools.islice(self.characters, len(word) - 1,
-                                           None)
-        self.update_chars()
+        self.jump_to(end)
 
         return word
 
@@ -147,17 +142,12 @@ class Scanner(object):
         next_delim = None
         while True:
             if self.char == '&':
-                self.characters, lookahead = itertools.tee(self.characters)
-
                 # Skip any whitespace after '&'
-                # TODO: probably a better way here...
-                c = next(lookahead)
-                while c in ' \t':
-                    c = next(lookahead)
+                end = Scanner.blank_run.match(self.line, self.idx + 1).end()
 
                 # If end of line, then this is a line continuation.
                 # Otherwise, it is part of the string (or a syntax error)
-                if c == '\n':
+                if self.line[end:end + 1] == '\n':
                     next_delim = delim
                     break
                 else:
@@ -218,5 +208,15 @@ class Scanner(object):
         return word
 
     def update_chars(self):
-        self.char = next(self.characters)
         self.idx += 1
+        try:
+            self.char = self.line[self.idx]
+        except IndexError:
+            # Reading past an unterminated line ends the iteration, as it would
+            # for a character iterator.
+            raise StopIteration
+
+    def jump_to(self, idx):
+        """Move the scanner to character ``idx`` of the line."""
+        self.idx = idx - 1
+        self.update_chars()
@@ -19,6 +19,7 @@ class Source(object):
         # Configuration
         self.path = None
         self.include_paths = []
+        self.include_index = {}
         self.macros = {}
 
         # Contents
@@ -35,7 +36,7 @@ class Source(object):
         #  Using errors='replace' gets past these errors but will break
         #  roundtrip parsing.  This needs some additional thought.
         with open(path, errors='replace') as fpath:
-            lexer = Lexer(fpath, self.include_paths)
+            lexer = Lexer(fpath, self.include_paths, self.include_index)
             for stmt in lexer:
                 unit_type = get_program_unit_type(stmt)
                 unit = unit_type()
@@ -6,6 +6,8 @@
 
 
 class Statement(list):
+    __slots__ = ('tag', 'line_number')
+
     def __init__(self, *args, **kwds):
         # XXX: 'tag' is a dumb name, "type" or "class" is better but namespace
         #   issues ofc...
@@ -14,6 +16,17 @@ class Statement(list):
 
         super(Statement, self).__init__(*args, **kwds)
 
+    def paren_matches(self):
+        """Return a dict mapping each '(' index to its matching ')' index."""
+        matches = {}
+        opened = []
+        for idx, tok in enumerate(self):
+            if tok.key == '(':
+                opened.append(idx)
+            elif tok.key == ')' and opened:
+                matches[opened.pop()] = idx
+        return matches
+
     # XXX: Dumb name... override __str__?
     def gen_stmt(self):
         """Recreate the statement by gathering tokens and null tokens."""
@@ -32,4 +45,4 @@ class Statement(list):
     def reformat(self):
         """This is just a placeholder at the moment, but the idea is that this
         will 'reformat' the text according to a style guide."""
-        return ' '.join([str(tok) for tok in self])
+        return ' '.join(map(str, self))
@@ -6,7 +6,8 @@ lexeme, but it also contains a ``head`` and ``tail`` which contain the adjacent
 "liminal" tokens.
 
 Equality and hash tests use the case-insensitive forms, like good little
-Fortran tokens.
+Fortran tokens.  The lowercase form is computed once and stored as ``key``;
+keys are interned, so keyword tables can be searched with plain strings.
 
 (By "liminal" I mean the whitespace tokens between the semantic tokens.)
 
@@ -17,6 +18,7 @@ parsing output.
 :copyright: Copyright 2021 Marshall Ward, see AUTHORS for details.
 :license: Apache License, Version 2.0, see LICENSE for details.
 """
+import sys
 
 
 class Token(str):
@@ -24,15 +26,16 @@ class Token(str):
     #   (At least that is my understanding...)
     def __new__(cls, value='', *args, **kwargs):
         tok = str.__new__(cls, value, *args)
+        tok.key = sys.intern(tok.lower())
         tok.head = []
         tok.tail = []
         return tok
 
     def __eq__(self, other):
-        return self.lower() == other.lower()
+        return self.key == other.lower()
 
     def __hash__(self):
-        return hash(str(self).lower())
+        return hash(self.key)
 
 
 class PToken(Token):
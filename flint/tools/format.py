@@ -6,9 +6,11 @@
 import flint
 
 
-def format_statements(srcdirs, includes=None, excludes=None):
-    proj = flint.parse(*srcdirs, includes=includes, excludes=excludes)
+def format_statements(srcdirs, includes=None, excludes=None, jobs=1):
+    proj = flint.parse(*srcdirs, includes=includes, excludes=excludes,
+                       jobs=jobs)
 
     for src in proj.sources:
-        for stmt in src.statements:
-            print(stmt.reformat())
+        # Write each source at once, rather than one print per statement
+        if src.statements:
+            print('\n'.join(stmt.reformat() for stmt in src.statements))
@@ -8,8 +8,10 @@ import os
 import flint
 
 
-def generate_docs(srcdirs, docdir, includes=None, excludes=None):
-    proj = flint.parse(*srcdirs, includes=includes, excludes=excludes)
+def generate_docs(srcdirs, docdir, includes=None, excludes=None,
+        jobs=1):
+    proj = flint.parse(*srcdirs, includes=includes, excludes=excludes,
+                       jobs=jobs)
 
     os.makedirs(docdir, exist_ok=True)
 
@@ -117,7 +119,7 @@ def print_unit(doc, unit, depth, graph=None):
         doc.write(indent + 'Calls into\n')
         doc.write(
             indent + '  '
-            + ' '.join('|{0}|_'.format(callee) for callee in unit.callees)
+            + ' '.join(map('|{0}|_'.format, unit.callees))
             + '\n'
         )
         doc.write('\n')
@@ -127,9 +129,7 @@ def print_unit(doc, unit, depth, graph=None):
         doc.write(indent + 'Called by\n')
         doc.write(
             indent + '  '
-            + ' '.join(
-                '|{0}|_'.format(caller) for caller in graph[unit.name]
-            )
+            + ' '.join(map('|{0}|_'.format, graph[unit.name]))
             + '\n'
         )
         doc.write('\n')
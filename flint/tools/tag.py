@@ -6,9 +6,11 @@
 import flint
 
 
-def tag_statements(srcdirs, includes=None, excludes=None):
-    proj = flint.parse(*srcdirs, includes=includes, excludes=excludes)
+def tag_statements(srcdirs, includes=None, excludes=None, jobs=1):
+    proj = flint.parse(*srcdirs, includes=includes, excludes=excludes,
+                       jobs=jobs)
 
     for src in proj.sources:
-        for stmt in src.statements:
-            print(stmt.gen_stmt())
+        # Write each source at once, rather than one print per statement
+        if src.statements:
+            print('\n'.join(stmt.gen_stmt() for stmt in src.statements))
@@ -3,14 +3,28 @@
 :copyright: Copyright 2021 Marshall Ward, see AUTHORS for details.
 :license: Apache License, Version 2.0, see LICENSE for details.
 """
-from flint.units.subroutine import Subroutine, is_subroutine
-from flint.units.function import Function, is_function
+from flint.units.subroutine import Subroutine, is_subroutine, subprog_attrs
+from flint.units.function import Function, is_function, decl_types
 from flint.units.module import Module, is_module
 from flint.units.submodule import Submodule, is_submodule
 from flint.units.program import Program
 
+# Tokens which can begin a subroutine, function, module or submodule statement
+unit_stmt_keywords = frozenset(
+    subprog_attrs + decl_types + [
+        'subroutine',
+        'function',
+        'module',
+        'submodule',
+    ]
+)
+
 
 def get_program_unit_type(line):
+    # Skip the statement tests if the first token cannot begin a unit
+    if line[0].key not in unit_stmt_keywords:
+        return Program
+
     if is_subroutine(line):
         return Subroutine
     elif is_function(line):
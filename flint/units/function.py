@@ -8,7 +8,7 @@ from flint.units.subroutine import is_prefix
 from flint.units.subroutine import is_args
 # TODO: This is dumb
 #   Also rename it in subroutine..
-from flint.units.subroutine import subprog_attrs
+from flint.units.subroutine import subprog_attrs_set
 
 
 intrinsic_types = [
@@ -24,9 +24,12 @@ decl_types = intrinsic_types + [
     'type',
     'class',
 ]
+decl_types_set = frozenset(decl_types)
 
 
 class Function(Unit):
+    __slots__ = ()
+
     # Placeholder class for now
     def __init__(self):
         super(Function, self).__init__()
@@ -46,7 +49,7 @@ def is_function(line):
     # NOTE: This could fail if a type has the same name as an attribute.
     return_type, attrs = [], []
     for tok in prefix:
-        (attrs if tok in subprog_attrs else return_type).append(tok)
+        (attrs if tok.key in subprog_attrs_set else return_type).append(tok)
 
     if return_type and not is_declaration_type(return_type):
         return False
@@ -65,7 +68,7 @@ def is_function(line):
 def is_declaration_type(decl):
     # TODO: only one type can exist
     # TODO: Ignoring KIND and type names for now, will come back to this
-    if decl[0] not in decl_types:
+    if decl[0].key not in decl_types_set:
         return False
 
     return True
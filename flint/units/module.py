@@ -8,6 +8,8 @@ from flint.units.unit import Unit
 
 
 class Module(Unit):
+    __slots__ = ()
+
     intrinsics = [
         # ISO/IEC Technical Report (TR) 15580:1998(E)
         'ieee_arithmetic',
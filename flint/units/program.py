@@ -11,5 +11,7 @@ from flint.units.unit import Unit
 
 
 class Program(Unit):
+    __slots__ = ()
+
     def __init__(self):
         super(Program, self).__init__()
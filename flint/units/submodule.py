@@ -7,6 +7,8 @@ from flint.units.unit import Unit
 
 
 class Submodule(Unit):
+    __slots__ = ()
+
     # Placeholder class for now
     def __init__(self):
         super(Submodule, self).__init__()
@@ -13,9 +13,12 @@ subprog_attrs = [
     'pure',
     'recursive',
 ]
+subprog_attrs_set = frozenset(subprog_attrs)
 
 
 class Subroutine(Unit):
+    __slots__ = ()
+
     def __init__(self):
         super(Subroutine, self).__init__()
 
@@ -41,7 +44,7 @@ def is_subroutine(line):
 def is_prefix(prefix):
     """Return True if `prefix` is a valid subroutine prefix."""
     for spec in prefix:
-        if spec not in subprog_attrs:
+        if spec.key not in subprog_attrs_set:
             return False
         if prefix.count(spec) > 1:
             return False
@@ -77,7 +80,7 @@ def is_args(args):
             return False
 
         name_spec = bind[3:-1]
-        if name_spec and name_spec[0:3] != (',', 'name', '='):
+        if name_spec and tuple(name_spec[0:3]) != (',', 'name', '='):
             return False
 
         # TODO: validate the name
@@ -9,8 +9,7 @@ from flint.calls import get_callable_symbols
 from flint.construct import Construct
 from flint.document import is_docstring, is_docgroup, docstrip, Document
 from flint.interface import Interface
-from flint.intrinsics import intrinsic_fns
-from flint.statement import Statement
+from flint.intrinsics import intrinsic_fns_set
 from flint.variable import Variable
 
 
@@ -26,12 +25,19 @@ class Unit(object):
         # presence here.  But it should not be here.
         'type',
     ]
+    _unit_types_set = frozenset(unit_types)
+
+    # Single-token end statements of each unit type (e.g. `end`, `endmodule`)
+    _end_forms_of = {
+        utype: frozenset(('end', 'end' + utype)) for utype in unit_types
+    }
 
     # access-spec
     access_specs = [
         'public',
         'private',
     ]
+    _access_set = frozenset(access_specs)
 
     # attr-spec
     attribute_specs = access_specs + [
@@ -61,6 +67,7 @@ class Unit(object):
         'type',
         'enum',         # ENUM, BIND(C)
         'generic',
+        'abstract',     # ABSTRACT INTERFACE
         'interface',
         'parameter',
         'procedure',
@@ -76,18 +83,48 @@ class Unit(object):
         'pure',
         'recursive',
     ]
+    _prefix_set = frozenset(unit_prefix)
+    _intrinsic_set = frozenset(Variable.intrinsic_types)
+
+    # Tokens which can begin a unit statement
+    _unit_first = _unit_types_set | _prefix_set
+
+    __slots__ = (
+        'name',
+        'utype',
+        '_end_forms',
+        '_end_utype',
+        'subprograms',
+        'variables',
+        'interfaces',
+        'derived_types',
+        'namelists',
+        '_arrays',
+        'used_modules',
+        'callees',
+        'doc',
+        'grp_docstr',
+        'statements',
+    )
 
     def __init__(self):
         self.name = None
         self.utype = None
 
+        # End statement forms, set by parse_header()
+        self._end_forms = frozenset()
+        self._end_utype = None
+
         self.subprograms = []
         self.variables = []
-        self.interfaces = []
-        self.derived_types = []
+        # Most units have no interfaces or derived types, so these begin as
+        # empty tuples and are replaced by lists on the first append.
+        self.interfaces = ()
+        self.derived_types = ()
         self.namelists = {}
 
         # Internal set of array namespace, to rule out potential external functions
+        #   (Names are stored by their lowercase keys.)
         self._arrays = set()
 
         # Call tree properties
@@ -106,44 +143,46 @@ class Unit(object):
     def statement(stmt):
         # TODO: If this ends up being a full type-statement parser, then it
         # needs to be moved into its own class
-        idx = next((i for i, w in enumerate(stmt) if w in Unit.unit_types), -1)
 
-        if idx == 0:
-            return True
-        elif idx > 0:
-            words = iter(stmt[:idx])
+        # Most statements are ruled out by their first token
+        if stmt[0].key not in Unit._unit_first:
+            return False
 
-            word = next(words)
-            while True:
-                try:
-                    if word in Variable.intrinsic_types:
-                        word = next(words)
-                        if word == '(':
-                            # TODO: Parse this more formally
-                            while word != ')':
-                                word = next(words)
-                    elif word not in Unit.unit_prefix:
-                        return False
-
-                    word = next(words)
-                except StopIteration:
-                    break
-            return True
+        # Validate any prefix tokens until the unit type is found.  (Tokens
+        # skipped after an intrinsic type may also be the unit type.)
+        unit_types = Unit._unit_types_set
+        n = len(stmt)
+        i = 0
+        while i < n:
+            word = stmt[i]
+            if word.key in unit_types:
+                return True
+            elif word.key in Unit._intrinsic_set:
+                # Skip the following token, or the kind selector
+                i += 1
+                if i < n and stmt[i] == '(':
+                    # TODO: Parse this more formally
+                    while i < n and stmt[i] != ')':
+                        if stmt[i].key in unit_types:
+                            return True
+                        i += 1
+                if i < n and stmt[i].key in unit_types:
+                    return True
+            elif word.key not in Unit._prefix_set:
+                return False
 
-        else:
-            return False
+            i += 1
+
+        return False
 
     def end_statement(self, stmt):
         assert self.utype
 
         # TODO: Very similar to construct... can I merge somehow?
-        if stmt[0].startswith('end'):
-            if len(stmt) == 1 and stmt[0] in ('end', 'end' + self.utype):
-                return True
-            elif len(stmt) >= 2 and (stmt[0], stmt[1]) == ('end', self.utype):
-                return True
-            else:
-                return False
+        if len(stmt) == 1:
+            return stmt[0].key in self._end_forms
+        else:
+            return stmt[0].key == 'end' and stmt[1].key == self._end_utype
 
     def parse(self, statements, graph=None):
         """Parse the statements of a program unit.
@@ -153,11 +192,11 @@ class Unit(object):
         """
         self.parse_header(statements.current_line)
         self.parse_specification(statements)
-        self.parse_execution(statements)
-        self.parse_subprogram(statements, graph=graph)
+        if self.parse_execution(statements):
+            self.parse_subprogram(statements, graph=graph)
 
         # Remove intrinsic functions from the set of callables
-        self.callees = self.callees - set(intrinsic_fns)
+        self.callees.difference_update(intrinsic_fns_set)
 
         # Assign this unit as caller for each callee
         if graph is not None:
@@ -184,15 +223,20 @@ class Unit(object):
         Each program unit has a different header format, so this method must be
         overridden by each subclass.
         """
-        if any(tok in Unit.unit_types for tok in stmt):
-            self.utype = next(w for w in stmt if w in Unit.unit_types)
-            utype_idx = stmt.index(self.utype)
+        for utype_idx, tok in enumerate(stmt):
+            if tok.key in Unit._unit_types_set:
+                self.utype = tok
+                break
         else:
             # Assume anonymous main
             self.utype = 'program'
             utype_idx = None
             # TODO: But now we need to re-parse stmt??
 
+        # Single-token (`end`, `endsubroutine`) and two-token end statements
+        self._end_utype = self.utype.lower()
+        self._end_forms = Unit._end_forms_of[self._end_utype]
+
         self.doc.header = docstrip(stmt[0].head)
         self.doc.docstring = docstrip(stmt[-1].tail)
         self.doc.statement = stmt
@@ -229,18 +273,15 @@ class Unit(object):
         """
         # TODO: `use`, `implicit`, and declarations must appear in that order.
         #       This loop does not check order.
+        # TODO: PARAMETER, FORMAT, ENTRY in the implicit-part
         for stmt in statements:
-            if stmt[0] == 'use':
-                self.parse_use_stmt(stmt)
-            elif stmt[0] == 'import':
-                self.parse_import_stmt(stmt)
-            elif stmt[0] == 'implicit':
-                # TODO: PARAMETER, FORMAT, ENTRY
-                self.parse_implicit_stmt(stmt)
-            elif stmt[0] in Unit.declaration_types:
+            parse_stmt = Unit._spec_parsers.get(stmt[0].key)
+            if parse_stmt is None:
+                break
+            elif parse_stmt is Unit.parse_declaration_construct:
                 self.parse_declaration_construct(statements, stmt)
             else:
-                break
+                parse_stmt(self, stmt)
 
     def parse_use_stmt(self, stmt):
         """Parse a use-stmt from the grammar
@@ -269,10 +310,12 @@ class Unit(object):
 
     def parse_declaration_construct(self, statements, stmt):
         if stmt[0] == 'interface' or (
-                len(stmt) > 1 and stmt[:2] == ('abstract', 'interface')
+                len(stmt) > 1 and tuple(stmt[:2]) == ('abstract', 'interface')
         ):
             block = Interface()
             block.parse(statements)
+            if not self.interfaces:
+                self.interfaces = []
             self.interfaces.append(block)
             self.statements.extend(block.statements)
 
@@ -284,10 +327,12 @@ class Unit(object):
             # TODO: I think this is OK, since these are never defined as
             #   comma-separated lists, but need to check into this
             dtype.name = stmt[-1]
+            if not self.derived_types:
+                self.derived_types = []
             self.derived_types.append(dtype)
             self.statements.extend(dtype.statements)
 
-        elif stmt[0] in Unit.access_specs:
+        elif stmt[0].key in Unit._access_set:
             stmt.tag = 'd'
             self.statements.append(stmt)
 
@@ -302,21 +347,23 @@ class Unit(object):
             self.statements.append(stmt)
 
         else:
-            tokens = iter(stmt)
+            close_of = stmt.paren_matches()
 
-            tok = next(tokens)
+            idx = 0
+            tok = stmt[idx]
 
             # Check for any group tokens
             if (is_docstring(tok.head) and is_docgroup(tok.head)):
                 # XXX: Use [2:] to strip '{ ', maybe do this in docstrip...?
                 self.grp_docstr = docstrip(tok.head)[2:]
 
-            if tok in Variable.intrinsic_types:
+            if tok.key in Unit._intrinsic_set:
                 vtype = tok
             elif tok in ('type', 'class'):
-                assert next(tokens) == '('
-                vtype = next(tokens)
-                assert next(tokens) == ')'
+                assert stmt[1] == '('
+                vtype = stmt[2]
+                assert stmt[3] == ')'
+                idx = 3
             elif tok == 'namelist':
                 self.parse_namelist(stmt)
                 return
@@ -327,16 +374,17 @@ class Unit(object):
                 return
 
             # Character length parsing
-            tok = next(tokens)
-            if vtype == 'character':
-                if tok == '*':
-                    tok = next(tokens)
+            idx += 1
+            tok = stmt[idx]
+            if vtype.key == 'character':
+                if tok.key == '*':
+                    idx += 1
+                    tok = stmt[idx]
 
             # Kind (or len) statement
-            if tok == '(':
-                while tok != ')':
-                    tok = next(tokens)
-                tok = next(tokens)
+            if tok.key == '(':
+                idx = close_of[idx] + 1
+                tok = stmt[idx]
 
             # Attributes
 
@@ -344,90 +392,87 @@ class Unit(object):
             var_intent = None
             is_array = False
 
-            while tok == ',':
-                tok = next(tokens)
+            while tok.key == ',':
+                idx += 1
+                tok = stmt[idx]
                 attr = tok
 
-                if attr == 'intent':
-                    tok = next(tokens)
+                if attr.key == 'intent':
+                    idx += 1
+                    tok = stmt[idx]
                     assert tok == '('
-                    var_intent = next(tokens)
+                    idx += 1
+                    var_intent = stmt[idx]
                     assert var_intent in ('in', 'out', 'inout')
-                    tok = next(tokens)
+                    idx += 1
+                    tok = stmt[idx]
 
                     # Fortran permits a space between `inout`, so check the
                     # next token.  (NOTE: `out in` is not allowed!)
-                    if var_intent == 'in' and tok == 'out':
+                    if var_intent.key == 'in' and tok.key == 'out':
                         var_intent += tok
-                        tok = next(tokens)
+                        idx += 1
+                        tok = stmt[idx]
 
                     assert tok == ')'
 
                 # TODO: We mostly skip over this information
-                elif attr == 'dimension':
+                elif attr.key == 'dimension':
                     is_array = True
 
-                    tok = next(tokens)
-                    assert tok == '('
-                    par_count = 1
-                    while par_count > 0:
-                        tok = next(tokens)
-                        if tok == '(':
-                            par_count += 1
-                        elif tok == ')':
-                            par_count -= 1
-
+                    idx += 1
+                    assert stmt[idx] == '('
+                    idx = close_of[idx]
 
-                tok = next(tokens)
+                idx += 1
+                tok = stmt[idx]
 
-            if tok == '::':
-                tok = next(tokens)
+            if tok.key == '::':
+                idx += 1
+                tok = stmt[idx]
 
             var = Variable(tok, vtype)
             var.intent = var_intent
+            var_idx = idx
             if is_array:
-                self._arrays.add(var.name)
+                self._arrays.add(var.name.key)
 
             # First doc attempt: After the variable name
             #   Also, attempt to apply the group docstring if it's been set
-            if is_docstring(tok.tail) and not is_docgroup(tok.tail):
-                var.doc.docstring = docstrip(tok.tail)
-            elif self.grp_docstr:
-                var.doc.docstring = self.grp_docstr
+            self.apply_var_doc(var, tok)
 
             self.variables.append(var)
 
-            for tok in tokens:
-                is_inline_array = False
-                if tok == '(':
-                    is_inline_array = True
-
-                    while tok != ')':
-                        tok = next(tokens)
+            idx += 1
+            while idx < len(stmt):
+                tok = stmt[idx]
+                if tok.key == '(':
+                    # Array bounds directly follow the variable name
+                    if idx == var_idx + 1:
+                        self._arrays.add(var.name.key)
 
-                # Second doc attempt: After the index right parenthesis
-                if is_docstring(tok.tail) and not is_docgroup(tok.tail):
-                    self.variables[-1].doc.docstring = docstrip(tok.tail)
-                elif self.grp_docstr:
-                    var.doc.docstring = self.grp_docstr
+                    idx = close_of[idx]
+                    tok = stmt[idx]
 
-                if tok == ',':
-                    # Third doc attempt: After the comma
-                    # XXX: Can this one be removed?
-                    if is_docstring(tok.tail) and not is_docgroup(tok.tail):
-                        self.variables[-1].doc.docstring = docstrip(tok.tail)
-                    elif self.grp_docstr:
-                        var.doc.docstring = self.grp_docstr
+                # Second doc attempt: After the index right parenthesis, or
+                # after the comma.  (This covers the comma token as well, so
+                # it is not checked again below.)
+                self.apply_var_doc(var, tok)
 
-                    tok = next(tokens)
+                if tok.key == ',':
+                    idx += 1
+                    tok = stmt[idx]
 
                     var = Variable(tok, vtype)
                     var.intent = var_intent
+                    var_idx = idx
                     if is_docstring(tok.tail):
                         var.doc.docstring = docstrip(tok.tail)
                     self.variables.append(var)
-                    if is_array or is_inline_array:
-                        self._arrays.add(var.name)
+                    if is_array:
+                        self._arrays.add(var.name.key)
+
+                idx += 1
 
             # Clear the group docstring
             if is_docstring(stmt[-1].tail) and is_docgroup(stmt[-1].tail):
@@ -436,25 +481,46 @@ class Unit(object):
             stmt.tag = 'D'
             self.statements.append(stmt)
 
+    def apply_var_doc(self, var, tok):
+        """Apply the docstring following `tok`, or the group docstring, to
+        the variable."""
+        tail = tok.tail
+        if is_docstring(tail) and not is_docgroup(tail):
+            var.doc.docstring = docstrip(tail)
+        elif self.grp_docstr:
+            var.doc.docstring = self.grp_docstr
+
+    # Specification statement parsers, indexed by the leading keyword
+    _spec_parsers = dict.fromkeys(
+        declaration_types, parse_declaration_construct
+    )
+    _spec_parsers.update({
+        'use': parse_use_stmt,
+        'import': parse_import_stmt,
+        'implicit': parse_implicit_stmt,
+    })
+
     def parse_namelist(self, stmt):
         assert stmt[0] == 'namelist'
-        tokens = iter(stmt[1:])
+        tokens = iter(stmt)
+        next(tokens)
 
         tok = next(tokens)
         while tok:
             assert tok == '/'
             # TODO: Validate group name
             nml_group = next(tokens)
-            self.namelists[nml_group] = []
+            # NOTE: A repeated group name continues the earlier group list
+            nml_objects = self.namelists.setdefault(nml_group, [])
             assert next(tokens) == '/'
 
             tok = next(tokens)
-            while tok and tok != '/':
+            while tok and tok.key != '/':
                 # TODO: Validate object name
-                self.namelists[nml_group].append(tok)
+                nml_objects.append(tok)
                 tok = next(tokens, None)
                 assert tok in (',', '/', None)
-                if tok == ',':
+                if tok and tok.key == ',':
                     tok = next(tokens)
 
         stmt.tag = 'N'
@@ -463,6 +529,11 @@ class Unit(object):
     # Execution
 
     def parse_execution(self, statements):
+        """Parse the execution-part of a program unit.
+
+        Returns True if the part is terminated by a `contains` statement,
+        and False if terminated by the unit's end statement.
+        """
         stmt = statements.current_line
 
         # Gather up any callable symbols
@@ -474,29 +545,43 @@ class Unit(object):
             cons = Construct(self)
             cons.parse(statements)
             self.statements.extend(cons.statements)
-        elif self.end_statement(stmt) or stmt[0] == 'contains':
-            return
+        elif self.end_statement(stmt):
+            return False
+        elif stmt[0] == 'contains':
+            return True
         else:
             # Unhandled
             stmt.tag = 'E'
             self.statements.append(stmt)
 
+        # Bind the loop's methods and attributes to locals
+        add_callees = self.callees.update
+        arrays = self._arrays
+        construct_stmt = Construct.construct_stmt
+        end_statement = self.end_statement
+        append_stmt = self.statements.append
+        extend_stmts = self.statements.extend
+
         # Now iterate over the rest of the statements
         for stmt in statements:
-            self.callees.update(get_callable_symbols(stmt, self._arrays))
+            add_callees(get_callable_symbols(stmt, arrays))
 
             # Execution constructs
-            if Construct.construct_stmt(stmt):
+            if construct_stmt(stmt):
                 cons = Construct(self)
                 cons.parse(statements)
-                self.statements.extend(cons.statements)
-            elif self.end_statement(stmt) or stmt[0] == 'contains':
-                # TODO: Use return?
-                break
+                extend_stmts(cons.statements)
+            elif end_statement(stmt):
+                return False
+            elif stmt[0] == 'contains':
+                return True
             else:
                 # Unhandled
                 stmt.tag = 'E'
-                self.statements.append(stmt)
+                append_stmt(stmt)
+
+        # Statements were exhausted before the end of the unit
+        return False
 
     def parse_subprogram(self, statements, graph=None):
         stmt = statements.current_line
@@ -506,7 +591,8 @@ class Unit(object):
         #  2. Am I the end statement for the parent Unit?  Exit immediately
         #  3. Otherwise keep going.
         #
-        # In practice, I think 1 can never happen, and 3 is always 'contains'.
+        # In practice, I think 1 can never happen, and 3 is always 'contains'
+        # (parse_execution() only hands over at a `contains` statement).
         # So the logic here seems very flawed.
         # But it hasn't yet caused any problems, so I leave it for now.
         #
@@ -523,15 +609,20 @@ class Unit(object):
             stmt.tag = self.utype[0].upper()
             self.statements.append(stmt)
 
+        unit_statement = Unit.statement
+        end_statement = self.end_statement
+        append_stmt = self.statements.append
+        extend_stmts = self.statements.extend
+
         for stmt in statements:
-            if Unit.statement(stmt):
+            if unit_statement(stmt):
                 subprog = Unit()
                 subprog.parse(statements, graph=graph)
                 self.subprograms.append(subprog)
-                self.statements.extend(subprog.statements)
-            elif self.end_statement(stmt):
+                extend_stmts(subprog.statements)
+            elif end_statement(stmt):
                 # TODO: Use return?
                 break
             else:
                 stmt.tag = 'X'
-                self.statements.append(stmt)
+                append_stmt(stmt)
@@ -0,0 +1,155 @@
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+
+sys.path.insert(1, '../')
+import flint
+from flint.units import Module, Subroutine
+
+
+def parse_source(text):
+    """Parse the Fortran source ``text`` and return its ``Source``."""
+    with tempfile.TemporaryDirectory() as srcdir:
+        path = os.path.join(srcdir, 'test.f90')
+        with open(path, 'w') as src:
+            src.write(textwrap.dedent(text))
+
+        project = flint.parse(path)
+
+    return project.sources[0]
+
+
+class Test(unittest.TestCase):
+
+    def test_module_procedure(self):
+        src = parse_source("""\
+            module m
+              interface gen
+                module procedure foo
+                procedure :: bar
+              end interface gen
+            end module m
+            """)
+
+        iface = src.units[0].interfaces[0]
+        self.assertEqual(iface.name, 'gen')
+        self.assertEqual(iface.procedures, ['foo', 'bar'])
+
+    def test_bind_name_subroutine(self):
+        src = parse_source("""\
+            subroutine f(x) bind(c, name='f')
+              real :: x
+            end subroutine f
+            """)
+
+        self.assertIsInstance(src.units[0], Subroutine)
+
+    def test_abstract_interface(self):
+        src = parse_source("""\
+            module m
+              abstract interface
+                subroutine cb(x)
+                  real, intent(in) :: x
+                end subroutine cb
+              end interface
+              type :: mytype
+                integer :: n
+              end type mytype
+            end module m
+            """)
+
+        mod = src.units[0]
+        self.assertIsInstance(mod, Module)
+        self.assertEqual(len(mod.interfaces), 1)
+        self.assertTrue(mod.interfaces[0].abstract)
+        self.assertEqual([dtype.name for dtype in mod.derived_types],
+                         ['mytype'])
+        self.assertNotIn('E', [stmt.tag for stmt in src.statements])
+
+    def test_uppercase_end_statements(self):
+        src = parse_source("""\
+            MODULE M
+              INTERFACE GEN
+                MODULE PROCEDURE S1
+              END INTERFACE GEN
+            CONTAINS
+              SUBROUTINE S1(N)
+                INTEGER :: N
+                IF (N > 0) THEN
+                  CALL F0(N)
+                END IF
+                DO N = 1, 2
+                  CALL G0(N)
+                END DO
+              END SUBROUTINE S1
+              SUBROUTINE S2()
+                CALL EXT1()
+              END SUBROUTINE S2
+            END MODULE M
+            """)
+
+        mod = src.units[0]
+        self.assertEqual(mod.interfaces[0].procedures, ['s1'])
+        self.assertEqual([sub.name for sub in mod.subprograms], ['s1', 's2'])
+
+        s1, s2 = mod.subprograms
+        self.assertEqual(s1.callees, {'f0', 'g0'})
+        self.assertEqual(s2.callees, {'ext1'})
+
+    def test_construct_callees(self):
+        src = parse_source("""\
+            subroutine s(n)
+              integer :: n
+              real :: arr(10)
+              integer :: b(size(arr), 2), d
+              do while (n > 0)
+                if (n > 1) then
+                  call f(arr(n))
+                else if (n < 0) then
+                  b(1, 1) = g(n)
+                end if
+                select case (n)
+                case (1)
+                  d = h(n)
+                end select
+              end do
+            end subroutine s
+            """)
+
+        sub = src.units[0]
+        self.assertEqual(sub._arrays, {'arr', 'b'})
+        self.assertEqual(sub.callees, {'f', 'g', 'h'})
+
+    def test_repeated_namelist_group(self):
+        src = parse_source("""\
+            module m
+              integer :: ka, kb, w
+              character(len=8) :: name
+              namelist /nml1/ ka, kb /nml2/ name
+              namelist /nml1/ w
+            end module m
+            """)
+
+        namelists = src.units[0].namelists
+        self.assertEqual(namelists['nml1'], ['ka', 'kb', 'w'])
+        self.assertEqual(namelists['nml2'], ['name'])
+
+    def test_nested_parentheses(self):
+        src = parse_source("""\
+            module m
+              real(kind=selected_real_kind(12)) :: y
+              integer :: a(size(y), 2), c
+              real, dimension(max(1, 2), 3) :: z
+            end module m
+            """)
+
+        mod = src.units[0]
+        self.assertEqual([var.name for var in mod.variables],
+                         ['y', 'a', 'c', 'z'])
+        self.assertEqual(mod._arrays, {'a', 'z'})
+
+
+if __name__ == '__main__':
+    unittest.main()